@@ -4,14 +4,46 @@ Téléchargeur RAPIDE Archives de Haute-Garonne
 Multi-threadé + Split PDF automatique
 
 Dépendances:
-    pip install requests Pillow
+    pip install requests Pillow img2pdf
+
+Optionnel (décodage JPEG et réduction des pages plus rapides):
+    pip install PyTurboJPEG opencv-python-headless
+
+Optionnel (pages réduites ~15% plus légères): cjpegli (libjxl) dans le PATH
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import mmap
+import shutil
+import subprocess
+import threading
+import time
+import img2pdf
 from PIL import Image
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBOJPEG = TurboJPEG()
+except (ImportError, RuntimeError, OSError):
+    # Module ou libturbojpeg absent: on retombe sur le décodeur de Pillow
+    TURBOJPEG = None
+
+try:
+    import cv2
+except ImportError:
+    # Réduction via Pillow (Lanczos) à la place
+    cv2 = None
+
+# Encodeur jpegli: fichiers plus petits à qualité égale, donc plus de pages par PDF
+CJPEGLI = shutil.which("cjpegli")
 
 # ============================================================================
 #                           CONFIGURATION
@@ -30,8 +62,14 @@ MAX_PDF_SIZE_MB = 25
 # 2000 = très haute qualité, 1500 = bonne qualité, 1200 = léger
 MAX_WIDTH = 2000
 
-# Nombre de threads (3-5 semble OK, 20 se fait bloquer)
+# Qualité JPEG des pages réduites (les autres sont intégrées telles quelles)
+QUALITE_JPEG = 75
+
+# Nombre max de threads (3-5 semble OK, 20 se fait bloquer)
+# On démarre à THREADS_INITIAUX puis on s'adapte: +1 toutes les 16 pages
+# réussies, divisé par 2 dès que le serveur répond 429/503
 NB_THREADS = 20
+THREADS_INITIAUX = 4
 
 # ============================================================================
 
@@ -40,13 +78,97 @@ HEADERS = {
     "Referer": "https://archives.haute-garonne.fr/",
 }
 
+# Session partagée: connexions TCP/TLS réutilisées entre les pages (keep-alive)
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=NB_THREADS,
+    pool_maxsize=NB_THREADS,
+    # 429/503 ne sont pas réessayés ici: LIMITEUR doit les voir pour ralentir
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504])
+))
+
+# Réponses du serveur signifiant "trop de requêtes"
+STATUTS_SATURATION = (429, 503)
+TENTATIVES_SATURATION = 4
+
+# En-dessous, la réponse est une page d'erreur et non un scan
+TAILLE_MIN_PAGE = 10000
+
+# Bloc de copie réseau -> disque: peu de write() par page, mémoire bornée par thread
+TAILLE_BLOC = 256 * 1024
+
+# Pattern: .../XXXX_0008/XXXX_0008_0001.jpg
+RE_DOSSIER = re.compile(r'^(.*?)(\d{4})/([^/]+)(\d{4})(_\d{4}\.jpg)$')
+# Fallback: pattern simple
+RE_SIMPLE = re.compile(r'^(.*?)(\d{4})(\.jpg)$', re.IGNORECASE)
+
+# Barre de progression: découpée dans deux chaînes construites une fois
+LARGEUR_BARRE = 40
+BARRE_PLEINE = '█' * LARGEUR_BARRE
+BARRE_VIDE = '░' * LARGEUR_BARRE
+
+
+class LimiteurAIMD:
+    """Limite le nombre de requêtes simultanées (AIMD).
+
+    La limite monte de 1 toutes les `palier` réussites et est divisée par 2
+    à chaque saturation, jusqu'à se stabiliser sous le seuil du serveur.
+    Les requêtes lancées avant la dernière baisse appartiennent au même
+    épisode de saturation: leurs 429/503 ne la divisent pas une seconde fois.
+    """
+
+    def __init__(self, initial, maximum, palier=16):
+        self.limite = initial
+        self.maximum = maximum
+        self.palier = palier
+        self.en_cours = 0
+        self.reussites = 0
+        self.lancees = 0
+        self.derniere_baisse = 0
+        self.condition = threading.Condition()
+
+    def __enter__(self):
+        with self.condition:
+            while self.en_cours >= self.limite:
+                self.condition.wait()
+            self.en_cours += 1
+            # Numéro de la requête, à rendre à saturation()
+            self.lancees += 1
+            return self.lancees
+
+    def __exit__(self, *exc):
+        with self.condition:
+            self.en_cours -= 1
+            self.condition.notify()
+
+    def succes(self):
+        with self.condition:
+            self.reussites += 1
+            if self.reussites >= self.palier:
+                self.reussites = 0
+                if self.limite < self.maximum:
+                    self.limite += 1
+                    self.condition.notify()
+
+    def saturation(self, numero):
+        with self.condition:
+            if numero <= self.derniere_baisse:
+                return
+            self.limite = max(1, self.limite // 2)
+            self.reussites = 0
+            self.derniere_baisse = self.lancees
+
+
+LIMITEUR = LimiteurAIMD(THREADS_INITIAUX, NB_THREADS)
+
 
 def analyser_url(url):
     """Détecte le pattern: le numéro est dans le DOSSIER, pas le fichier."""
     url = requests.utils.unquote(url)
 
     # Pattern: .../XXXX_0008/XXXX_0008_0001.jpg
-    match = re.search(r'^(.*?)(\d{4})/([^/]+)(\d{4})(_\d{4}\.jpg)$', url)
+    match = RE_DOSSIER.search(url)
     if match:
         return {
             "type": "dossier",
@@ -57,7 +179,7 @@ def analyser_url(url):
         }
 
     # Fallback: pattern simple
-    match = re.search(r'^(.*?)(\d{4})(\.jpg)$', url, re.IGNORECASE)
+    match = RE_SIMPLE.search(url)
     if match:
         return {
             "type": "simple",
@@ -88,98 +210,256 @@ def generer_url(pattern, page):
         )
 
 
+def liberer_connexion(response, taille):
+    """Lit un petit corps rejeté pour rendre la connexion au pool (keep-alive).
+
+    Un corps non lu oblige requests à fermer la socket, et donc à refaire la
+    poignée de main TCP/TLS à la requête suivante. Un gros corps, ou un corps
+    de taille inconnue, coûte plus cher à lire qu'à fermer: on le laisse.
+    """
+    if 0 < taille <= TAILLE_MIN_PAGE:
+        response.content
+
+
 def telecharger_page(args):
     """Télécharge une seule page (pour thread)."""
     page, url, output_dir = args
     filename = os.path.join(output_dir, "page_{:04d}.jpg".format(page))
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-
-        if response.status_code == 200 and len(response.content) > 10000:
-            with open(filename, 'wb') as f:
-                f.write(response.content)
-            return (page, filename, None)
+        for tentative in range(TENTATIVES_SATURATION):
+            # stream=True: le corps est écrit par blocs au fil de l'eau, sans tout garder en mémoire
+            with LIMITEUR as numero, SESSION.get(url, stream=True, timeout=30, allow_redirects=True) as response:
+                statut = response.status_code
+                taille = int(response.headers.get("Content-Length", 0))
+                if statut not in STATUTS_SATURATION:
+                    # Rejet sur les seuls en-têtes: le scan n'est jamais téléchargé
+                    if statut != 200 or (taille and taille <= TAILLE_MIN_PAGE):
+                        liberer_connexion(response, taille)
+                        return (page, None, "status={} size={}".format(statut, taille))
+
+                    # Le serveur sert les scans en image/* ou octet-stream, jamais en texte
+                    type_contenu = response.headers.get("Content-Type", "")
+                    if type_contenu.startswith("text/"):
+                        liberer_connexion(response, taille)
+                        return (page, None, "type={}".format(type_contenu))
+
+                    response.raw.decode_content = True
+                    with open(filename, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=TAILLE_BLOC)
+                    LIMITEUR.succes()
+                    break
+
+                liberer_connexion(response, taille)
+                LIMITEUR.saturation(numero)
+
+            # Attendre hors du limiteur avant de réessayer (inutile après le dernier essai)
+            if tentative < TENTATIVES_SATURATION - 1:
+                time.sleep(0.5 * 2 ** tentative)
         else:
-            return (page, None, "size={}".format(len(response.content)))
+            return (page, None, "status={} (serveur saturé)".format(statut))
+
+        # Sans Content-Length, la taille n'est connue qu'une fois écrite
+        taille = os.path.getsize(filename)
+        if taille <= TAILLE_MIN_PAGE:
+            os.remove(filename)
+            return (page, None, "size={}".format(taille))
+        return (page, filename, None)
     except Exception as e:
         return (page, None, str(e))
 
 
-def creer_pdf_split(fichiers, output_base, max_size_mb, max_width):
-    """Crée plusieurs PDFs si nécessaire pour respecter la taille max."""
+def mapper_fichier(chemin):
+    """Projette un fichier en mémoire, en lecture seule (pas de copie par read())."""
+    with open(chemin, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def facteur_reduction(largeur, max_width):
+    """Plus grand facteur N (2, 4 ou 8) applicable au décodage sans passer sous max_width."""
+    for n in (8, 4, 2):
+        if largeur // n >= max_width:
+            return n
+    return 1
+
+
+def charger_image(chemin, facteur=1):
+    """Décode un JPEG en image RGB (libjpeg-turbo si disponible).
+
+    Avec facteur > 1, libjpeg réduit directement de 1/facteur pendant l'IDCT,
+    bien plus vite qu'un décodage complet suivi d'un redimensionnement.
+    """
+    if TURBOJPEG is not None:
+        echelle = (1, facteur) if facteur > 1 else None
+        # Pas de `with`: si decode échoue, la trace garde une vue sur mm et
+        # close() lèverait BufferError à la place de la vraie erreur
+        mm = mapper_fichier(chemin)
+        arr = TURBOJPEG.decode(mm, pixel_format=TJPF_RGB, scaling_factor=echelle)
+        mm.close()
+        return Image.fromarray(arr)
+
+    img = Image.open(chemin)
+    if facteur > 1:
+        img.draft('RGB', (img.width // facteur, img.height // facteur))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img
+
+
+def reduire_image(chemin, destination, largeur, max_width):
+    """Réduit un JPEG de `largeur` px à max_width de large et l'écrit dans destination."""
+    # Avec cjpegli, on écrit d'abord un PPM brut que l'encodeur externe compresse
+    cible = os.path.splitext(destination)[0] + ".ppm" if CJPEGLI else destination
+    facteur = facteur_reduction(largeur, max_width)
+
+    if cv2 is not None:
+        lecture = {
+            1: cv2.IMREAD_COLOR,
+            2: cv2.IMREAD_REDUCED_COLOR_2,
+            4: cv2.IMREAD_REDUCED_COLOR_4,
+            8: cv2.IMREAD_REDUCED_COLOR_8,
+        }[facteur]
+        arr = cv2.imread(chemin, lecture)
+        if arr is None:
+            raise OSError("image illisible")
+        # INTER_AREA: moyenne par blocs, bien plus rapide que Lanczos en réduction
+        h, w = arr.shape[:2]
+        if w > max_width:
+            arr = cv2.resize(arr, (max_width, int(h * max_width / w)), interpolation=cv2.INTER_AREA)
+        cv2.imwrite(cible, arr, [cv2.IMWRITE_JPEG_QUALITY, QUALITE_JPEG])
+    else:
+        img = charger_image(chemin, facteur)
+        if img.width > max_width:
+            ratio = max_width / img.width
+            new_size = (max_width, int(img.height * ratio))
+            img = img.resize(new_size, Image.LANCZOS)
+        img.save(cible, quality=QUALITE_JPEG)
+        img.close()
 
-    # Estimer le nombre de pages par PDF
-    # En moyenne ~300-400 Ko par page après compression
-    pages_par_pdf = int(max_size_mb * 1024 / 350)  # Estimation
+    if CJPEGLI:
+        subprocess.run([CJPEGLI, cible, destination, "-q", str(QUALITE_JPEG)],
+                       check=True, capture_output=True)
+        os.remove(cible)
 
-    if pages_par_pdf >= len(fichiers):
-        # Un seul PDF suffit
-        pages_par_pdf = len(fichiers)
 
-    print("   Estimation: ~{} pages par PDF de {} Mo max".format(pages_par_pdf, max_size_mb))
+def preparer_image(args):
+    """Prépare une page pour le PDF (pour processus).
 
-    pdf_num = 1
-    idx = 0
-    pdfs_crees = []
+    Renvoie le fichier d'origine s'il est assez petit, sinon une copie
+    réduite à max_width écrite à côté.
+    """
+    chemin, max_width = args
 
-    while idx < len(fichiers):
-        # Charger les images pour ce PDF
-        batch_files = fichiers[idx:idx + pages_par_pdf]
-        images = []
+    try:
+        # Image.open ne lit que l'en-tête: pas de décodage ici
+        with Image.open(chemin) as img:
+            largeur = img.width
 
-        print("\n   📄 PDF {} : pages {}-{}...".format(
-            pdf_num,
-            idx + 1,
-            min(idx + pages_par_pdf, len(fichiers))
-        ))
+        if largeur <= max_width:
+            return (chemin, chemin, None)
 
-        for f in batch_files:
-            try:
-                img = Image.open(f)
+        # Redimensionner si trop grand
+        reduite = os.path.splitext(chemin)[0] + "_reduite.jpg"
+        reduire_image(chemin, reduite, largeur, max_width)
+        return (chemin, reduite, None)
+    except Exception as e:
+        return (chemin, None, str(e))
 
-                # Redimensionner si trop grand
-                if img.width > max_width:
-                    ratio = max_width / img.width
-                    new_size = (max_width, int(img.height * ratio))
-                    img = img.resize(new_size, Image.LANCZOS)
 
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                images.append(img)
-            except Exception as e:
-                print("      ⚠ Erreur image {}: {}".format(f, e))
+def construire_pdf(args):
+    """Assemble un PDF à partir de JPEG déjà prêts (pour processus)."""
+    pages, pdf_name, a_supprimer = args
+
+    # Flux JPEG copiés tels quels, 100 dpi comme avant. L'orientation EXIF est
+    # ignorée comme avec Pillow (img2pdf refuse sinon certaines valeurs)
+    with open(pdf_name, 'wb') as out:
+        out.write(img2pdf.convert(pages, layout_fun=img2pdf.get_fixed_dpi_layout_fun((100, 100)),
+                                  rotation=img2pdf.Rotation.none))
 
-        if not images:
-            idx += pages_par_pdf
-            continue
+    # Supprimer les pages intégrées: le disque ne garde qu'environ un PDF d'avance
+    for page in a_supprimer:
+        os.remove(page)
 
-        # Créer le PDF
-        pdf_name = "{}_{}.pdf".format(output_base, pdf_num)
-        images[0].save(pdf_name, save_all=True, append_images=images[1:], resolution=100, quality=75)
+    taille_mo = os.path.getsize(pdf_name) / (1024 * 1024)
+    return (pdf_name, taille_mo, len(pages))
 
-        # Fermer les images
-        for img in images:
-            img.close()
 
-        # Vérifier la taille
-        taille_mo = os.path.getsize(pdf_name) / (1024 * 1024)
-        print("      ✓ {} ({:.1f} Mo, {} pages)".format(pdf_name, taille_mo, len(images)))
+def creer_pdf_split(file_pages, output_base, max_size_mb, max_width):
+    """Crée plusieurs PDFs si nécessaire pour respecter la taille max.
 
-        pdfs_crees.append((pdf_name, taille_mo, len(images)))
+    Les pages arrivent dans l'ordre par file_pages (None pour terminer),
+    pendant le téléchargement. Les JPEG sont intégrés sans recompression;
+    seules les pages plus larges que max_width sont décodées, réduites puis
+    réencodées. La taille d'un PDF est donc à peu près la somme de ses pages:
+    chaque PDF est lancé dès que son lot atteint le budget.
 
-        # Ajuster le nombre de pages pour le prochain PDF si nécessaire
-        if taille_mo > max_size_mb * 1.1:  # Plus de 10% au-dessus
-            pages_par_pdf = int(pages_par_pdf * max_size_mb / taille_mo)
-            print("      ↓ Ajustement: {} pages pour les prochains PDFs".format(pages_par_pdf))
-        elif taille_mo < max_size_mb * 0.7:  # Plus de 30% en-dessous
-            pages_par_pdf = int(pages_par_pdf * max_size_mb / taille_mo * 0.9)
-            print("      ↑ Ajustement: {} pages pour les prochains PDFs".format(pages_par_pdf))
+    N'affiche rien (tourne pendant la barre de progression): renvoie les PDFs
+    créés et les erreurs d'image ou de PDF. Un lot en échec n'empêche pas
+    les autres PDFs.
+    """
 
-        idx += len(batch_files)
-        pdf_num += 1
+    # Marge de 5% pour la structure du PDF
+    budget = max_size_mb * 1024 * 1024 * 0.95
 
-    return pdfs_crees
+    erreurs = []
+    constructions = []
+    lot = []
+    a_supprimer = []
+    cumul = 0
+
+    # Décodage/réduction et assemblage sur tous les cœurs (travail CPU, le GIL bloquerait des threads).
+    # "spawn": les téléchargements tournent déjà, un fork copierait leurs verrous
+    # (urllib3, SSL, LIMITEUR, stdout) dans un état pris et pourrait bloquer
+    contexte = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=contexte) as executor:
+        preparations = deque()
+        fin = False
+
+        while not fin or preparations:
+            if not fin:
+                chemin = file_pages.get()
+                if chemin is None:
+                    fin = True
+                else:
+                    preparations.append(executor.submit(preparer_image, (chemin, max_width)))
+
+            # Regrouper les pages prêtes, dans l'ordre, tant que le budget n'est pas dépassé
+            while preparations and (fin or preparations[0].done()):
+                f, page, err = preparations.popleft().result()
+                if not page:
+                    erreurs.append((f, err))
+                    continue
+
+                taille = os.path.getsize(page)
+                if lot and cumul + taille > budget:
+                    # Lot complet: son PDF se construit pendant que la suite arrive
+                    pdf_name = "{}_{}.pdf".format(output_base, len(constructions) + 1)
+                    constructions.append((pdf_name, executor.submit(construire_pdf, (lot, pdf_name, a_supprimer))))
+                    lot = []
+                    a_supprimer = []
+                    cumul = 0
+
+                lot.append(page)
+                a_supprimer.append(f)
+                if page != f:
+                    a_supprimer.append(page)
+                cumul += taille
+
+        if lot:
+            pdf_name = "{}_{}.pdf".format(output_base, len(constructions) + 1)
+            constructions.append((pdf_name, executor.submit(construire_pdf, (lot, pdf_name, a_supprimer))))
+
+        pdfs_crees = []
+        for pdf_name, construction in constructions:
+            try:
+                pdfs_crees.append(construction.result())
+            except Exception as e:
+                erreurs.append((pdf_name, e))
+                # Ne pas laisser un PDF à moitié écrit
+                if os.path.exists(pdf_name):
+                    os.remove(pdf_name)
+
+    return pdfs_crees, erreurs
 
 
 def main():
@@ -194,41 +474,73 @@ def main():
 
     print("\n✓ Pattern détecté: {}".format(pattern["type"]))
 
+    # Générer toutes les URLs une seule fois
+    pages = range(PAGE_DEBUT, PAGE_DEBUT + NB_PAGES)
+    urls = [generer_url(pattern, p) for p in pages]
+
     # Aperçu des URLs
     print("\n📋 Aperçu des URLs:")
-    for p in [1, 2, 3]:
-        print("   Page {}: ...{}".format(p, generer_url(pattern, p)[-70:]))
+    for p, url in zip(pages[:3], urls):
+        print("   Page {}: ...{}".format(p, url[-70:]))
 
     print("\n✓ {} pages à télécharger\n".format(NB_PAGES))
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # Préparer les tâches
-    taches = [(page, generer_url(pattern, page), OUTPUT_DIR)
-              for page in range(PAGE_DEBUT, PAGE_DEBUT + NB_PAGES)]
+    taches = [(p, url, OUTPUT_DIR) for p, url in zip(pages, urls)]
 
     # Téléchargement parallèle
-    print("📥 Téléchargement ({} threads)...\n".format(NB_THREADS))
-
-    fichiers = []
-    erreurs = []
+    print("📥 Téléchargement ({} à {} threads)...\n".format(THREADS_INITIAUX, NB_THREADS))
 
-    with ThreadPoolExecutor(max_workers=NB_THREADS) as executor:
-        futures = {executor.submit(telecharger_page, t): t[0] for t in taches}
+    # Les PDFs se construisent pendant le téléchargement, au fil des pages reçues
+    pages_pretes = queue.Queue()
+    assemblage = ThreadPoolExecutor(max_workers=1)
+    pdfs_futur = assemblage.submit(creer_pdf_split, pages_pretes, OUTPUT_PDF, MAX_PDF_SIZE_MB, MAX_WIDTH)
 
-        done = 0
-        for future in as_completed(futures):
-            done += 1
-            page, filepath, err = future.result()
-
-            if filepath:
-                fichiers.append(filepath)
-            else:
-                erreurs.append((page, err))
+    # Une case par page: les threads finissent dans le désordre, l'index remet en ordre
+    fichiers = [None] * NB_PAGES
+    terminees = [False] * NB_PAGES
+    prochaine = 0
+    erreurs = []
 
-            pct = done / NB_PAGES * 100
-            bar = '█' * int(pct / 2.5) + '░' * (40 - int(pct / 2.5))
-            print("\r   [{}] {:3.0f}% ({}/{})".format(bar, pct, done, NB_PAGES), end="", flush=True)
+    try:
+        with ThreadPoolExecutor(max_workers=NB_THREADS) as executor:
+            futures = {executor.submit(telecharger_page, t): t[0] for t in taches}
+
+            done = 0
+            dernier_pas = -1
+            for future in as_completed(futures):
+                done += 1
+                page, filepath, err = future.result()
+
+                terminees[page - PAGE_DEBUT] = True
+                if filepath:
+                    fichiers[page - PAGE_DEBUT] = filepath
+                else:
+                    erreurs.append((page, err))
+
+                # Transmettre les pages dès que toutes celles qui les précèdent sont arrivées
+                while prochaine < NB_PAGES and terminees[prochaine]:
+                    if fichiers[prochaine]:
+                        pages_pretes.put(fichiers[prochaine])
+                    prochaine += 1
+
+                # Ne réafficher la barre que tous les 0,5%
+                pct = done / NB_PAGES * 100
+                pas = int(pct * 2)
+                if pas != dernier_pas:
+                    dernier_pas = pas
+                    n = int(pct * LARGEUR_BARRE / 100)
+                    bar = BARRE_PLEINE[:n] + BARRE_VIDE[n:]
+                    print(f"\r   [{bar}] {pct:3.0f}% ({done}/{NB_PAGES})", end="", flush=True)
+    finally:
+        # Toujours débloquer l'assemblage, même sur erreur ou Ctrl-C,
+        # sinon son thread attend indéfiniment et bloque la sortie
+        pages_pretes.put(None)
+        assemblage.shutdown(wait=False)
+
+    fichiers = [f for f in fichiers if f]
 
     print("\n\n📊 Téléchargé: {}/{} pages".format(len(fichiers), NB_PAGES))
 
@@ -241,13 +553,19 @@ def main():
         print("❌ Aucune page téléchargée")
         return
 
-    # Trier les fichiers
-    fichiers.sort()
-
-    # Créer les PDFs
+    # Terminer les PDFs (les premiers sont déjà prêts)
     print("\n📄 Création des PDFs (max {} Mo chacun)...".format(MAX_PDF_SIZE_MB))
 
-    pdfs = creer_pdf_split(fichiers, OUTPUT_PDF, MAX_PDF_SIZE_MB, MAX_WIDTH)
+    pdfs, erreurs_images = pdfs_futur.result()
+
+    for f, err in erreurs_images:
+        print("      ⚠ Erreur {}: {}".format(f, err))
+
+    debut = 1
+    for pdf_num, (pdf_name, taille_mo, nb_pages) in enumerate(pdfs, 1):
+        print("   📄 PDF {} : pages {}-{}".format(pdf_num, debut, debut + nb_pages - 1))
+        print("      ✓ {} ({:.1f} Mo, {} pages)".format(pdf_name, taille_mo, nb_pages))
+        debut += nb_pages
 
     # Résumé
     print("\n" + "=" * 60)
@@ -262,15 +580,7 @@ def main():
 
     # Nettoyage
     print("\n🗑️  Nettoyage des fichiers temporaires...")
-    for f in fichiers:
-        try:
-            os.remove(f)
-        except:
-            pass
-    try:
-        os.rmdir(OUTPUT_DIR)
-    except:
-        pass
+    shutil.rmtree(OUTPUT_DIR, ignore_errors=True)
 
     print("\n🎉 Fini !")
 